@@ -18,6 +18,8 @@ from guardrails import get_guardrails
 from responsible_ai_pipeline import get_pipeline
 from audit_logger import get_audit_logger
 
+AUDIT_CSV_FILE = "data/audit_trail.csv"
+
 app = FastAPI(
     title="Mashreq Responsible AI API", 
     version="2.0",
@@ -67,12 +69,11 @@ def get_alerts():
 @app.post("/audit")
 def log_audit(action: AuditAction):
     """Log a human decision to the immutable audit trail."""
-    csv_file = "data/audit_trail.csv"
-    file_exists = os.path.isfile(csv_file)
     try:
-        with open(csv_file, mode='a', newline='') as f:
+        with open(AUDIT_CSV_FILE, mode='a', newline='') as f:
             writer = csv.writer(f)
-            if not file_exists:
+            # Append mode opens at end-of-file: position 0 means a new (or rotated) trail
+            if f.tell() == 0:
                 writer.writerow(["Timestamp", "User", "Action", "AlertID", "AI_Context"])
             writer.writerow([
                 datetime.now().isoformat(),
@@ -105,7 +106,7 @@ def run_simulation(req: SimulationRequest):
         "is_breach": bool(result['is_breach']),
         # Return a sample or histogram buckets to reduce payload size? 
         # For now, let's return a sample of 500 points for the chart
-        "simulation_sample": result['simulation_data'].tolist()[:500] 
+        "simulation_sample": result['simulation_data'][:500].tolist()
     }
 
 
@@ -18,6 +18,7 @@ Responsible AI Mapping:
 import csv
 import json
 import os
+from collections import Counter
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional
 from datetime import datetime
@@ -102,6 +103,8 @@ class AuditLogger:
         self.data_dir.mkdir(exist_ok=True)
         self.csv_path = self.data_dir / "audit_trail_full.csv"
         self.json_path = self.data_dir / "audit_log.json"
+        self._json_cache = None  # ((mtime_ns, size), records) of the last JSON read
+        self._csv_cache = None   # ((mtime_ns, size), bytes) of the last CSV export
         self._ensure_files()
     
     def _ensure_files(self):
@@ -115,6 +118,37 @@ class AuditLogger:
             with open(self.json_path, 'w', encoding='utf-8') as f:
                 json.dump([], f)
     
+    def _load_json_records(self) -> List[Dict[str, Any]]:
+        """
+        Read the JSON audit log, reusing the last parse while the file is unchanged.
+        Callers must not mutate the returned list.
+        """
+        try:
+            key = self._file_key(self.json_path)
+        except FileNotFoundError:
+            return []
+        
+        if self._json_cache is not None and self._json_cache[0] == key:
+            return self._json_cache[1]
+        
+        try:
+            with open(self.json_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        except json.JSONDecodeError:
+            records = []
+        
+        self._json_cache = (key, records)
+        return records
+    
+    @staticmethod
+    def _file_key(path: Path) -> tuple:
+        """
+        Cache key for a log file. Size is included because coarse mtimes (FAT/SMB,
+        some kernels) can miss an append made within the same tick.
+        """
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+    
     def _generate_record_id(self) -> str:
         """Generate unique record ID."""
         now = datetime.now()
@@ -221,20 +255,12 @@ class AuditLogger:
             writer = csv.DictWriter(f, fieldnames=self.CSV_HEADERS)
             writer.writerow(record.to_flat_dict())
         
-        # Append to JSON
-        try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                records = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            records = []
-        
-        records.append(record.to_dict())
-        
-        # Keep only last 1000 records in JSON (CSV keeps all)
-        records = records[-1000:]
+        # Append to JSON (keep only last 1000 records in JSON; CSV keeps all)
+        records = self._load_json_records()[-999:] + [record.to_dict()]
         
         with open(self.json_path, 'w', encoding='utf-8') as f:
             json.dump(records, f, indent=2)
+        self._json_cache = (self._file_key(self.json_path), records)
         
         return record.record_id
     
@@ -298,12 +324,19 @@ class AuditLogger:
         Returns:
             CSV file contents as bytes
         """
+        # The trail is append-only, so an unchanged (mtime, size) means an unchanged export
+        key = self._file_key(self.csv_path)
+        if self._csv_cache is not None and self._csv_cache[0] == key:
+            return self._csv_cache[1]
+        
         with open(self.csv_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # TODO: Implement date filtering if needed
         
-        return content.encode('utf-8')
+        data = content.encode('utf-8')
+        self._csv_cache = (key, data)
+        return data
     
     def get_recent_records(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -315,12 +348,7 @@ class AuditLogger:
         Returns:
             List of record dictionaries
         """
-        try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                records = json.load(f)
-            return records[-limit:]
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
+        return self._load_json_records()[-limit:]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get audit log statistics."""
@@ -333,20 +361,13 @@ class AuditLogger:
                 "categories": {}
             }
         
-        decisions = {}
-        categories = {}
-        
-        for r in records:
-            dec = r.get('human_decision', 'UNKNOWN')
-            decisions[dec] = decisions.get(dec, 0) + 1
-            
-            cat = r.get('signal_category', 'UNKNOWN')
-            categories[cat] = categories.get(cat, 0) + 1
+        decisions = Counter(r.get('human_decision', 'UNKNOWN') for r in records)
+        categories = Counter(r.get('signal_category', 'UNKNOWN') for r in records)
         
         return {
             "total_records": len(records),
-            "decisions": decisions,
-            "categories": categories,
+            "decisions": dict(decisions),
+            "categories": dict(categories),
             "last_updated": records[-1].get('timestamp') if records else None
         }
 
@@ -14,12 +14,16 @@ Author: Antigravity
 """
 
 import streamlit as st
-import pandas as pd
 import json
 import os
+import re
+import uuid
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 import time
+from collections import Counter, deque
+from itertools import islice
+from operator import attrgetter
 
 # Add src to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -29,7 +33,7 @@ from data_loader import load_csv_events
 from guardrails import get_guardrails
 from audit_logger import get_audit_logger
 from simulation_engine import SimulationEngine
-from governance_shield import GovernanceShield
+from governance_shield import get_governance_shield
 
 # Page config
 st.set_page_config(
@@ -43,7 +47,9 @@ st.set_page_config(
 # PREMIUM CSS THEME
 # ==============================================================================
 
-st.markdown("""
+# Streamlit drops any element a rerun does not re-emit, so the theme is sent on
+# every run; keeping it as a constant at least builds the string only once.
+THEME_CSS = """
 <style>
     /* =========== IMPORTS =========== */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800;900&display=swap');
@@ -113,7 +119,7 @@ st.markdown("""
         padding: 24px;
         margin-bottom: 20px;
         box-shadow: var(--shadow-lift);
-        transition: all 0.2s ease;
+        transition: transform 0.2s ease, box-shadow 0.2s ease, border-color 0.2s ease;
     }
     .glass-card:hover {
         transform: translateY(-2px);
@@ -130,7 +136,7 @@ st.markdown("""
         margin-bottom: 20px;
         position: relative;
         box-shadow: var(--shadow-lift);
-        transition: all 0.2s ease;
+        transition: transform 0.2s ease, box-shadow 0.2s ease, border-color 0.2s ease;
     }
     .signal-card:hover {
         transform: translateY(-2px);
@@ -222,7 +228,7 @@ st.markdown("""
         border-radius: 8px;
         padding: 10px 24px;
         font-weight: 600;
-        transition: all 0.2s ease;
+        transition: background-color 0.2s ease, box-shadow 0.2s ease, transform 0.2s ease;
         box-shadow: 0 2px 4px rgba(243, 112, 33, 0.2);
     }
     .stButton > button:hover {
@@ -266,25 +272,29 @@ st.markdown("""
         letter-spacing: 0.5px;
     }
     
-    /* =========== TABS =========== */
-    .stTabs [data-baseweb="tab-list"] {
-        background: transparent;
+    /* =========== MAIN NAVIGATION (the active_tab radio, styled as tabs) =========== */
+    .st-key-active_tab [role="radiogroup"] {
         border-bottom: 1px solid var(--brand-cloud);
         gap: 24px;
         padding-bottom: 0;
     }
-    .stTabs [data-baseweb="tab"] {
-        background: transparent;
+    .st-key-active_tab [role="radiogroup"] label {
+        margin: 0;
+        padding: 12px 0;
+        border-bottom: 3px solid transparent;
         color: var(--brand-slate);
         font-weight: 600;
-        padding: 12px 0;
-        border: none;
-        border-radius: 0;
     }
-    .stTabs [aria-selected="true"] {
-        background: transparent !important;
-        color: var(--brand-sunrise) !important;
-        border-bottom: 3px solid var(--brand-sunrise);
+    .st-key-active_tab [role="radiogroup"] label > div:first-child {
+        display: none;
+    }
+    .st-key-active_tab [role="radiogroup"] label p {
+        color: inherit;
+        font-weight: inherit;
+    }
+    .st-key-active_tab [role="radiogroup"] label:has(input:checked) {
+        color: var(--brand-sunrise);
+        border-bottom-color: var(--brand-sunrise);
     }
     
     /* =========== FORM ELEMENTS =========== */
@@ -314,22 +324,92 @@ st.markdown("""
         color: #16A34A;
         font-size: 0.9rem;
     }
+    
+    /* =========== SYSTEM HEALTH LEDS =========== */
+    .led-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 16px;
+    }
+    .led-card {
+        background: var(--bg-card);
+        border-radius: 10px;
+        padding: 10px;
+        text-align: center;
+        border: 1px solid var(--brand-cloud);
+        box-shadow: var(--shadow-lift);
+    }
+    .led-healthy { --led: #10B981; }
+    .led-latent { --led: #F59E0B; }
+    .led-critical { --led: #EF4444; }
+    .led-name {
+        font-size: 0.7rem;
+        color: var(--brand-slate);
+        text-transform: uppercase;
+    }
+    .led-dot {
+        height: 12px;
+        width: 12px;
+        background-color: var(--led);
+        border-radius: 50%;
+        display: inline-block;
+        box-shadow: 0 0 5px var(--led);
+    }
+    .led-status {
+        font-size: 0.8rem;
+        font-weight: 700;
+        color: var(--led);
+        margin-left: 5px;
+    }
+    .led-metrics {
+        font-size: 0.65rem;
+        color: var(--brand-slate);
+        margin-top: 2px;
+    }
 
 </style>
-""", unsafe_allow_html=True)
+"""
+
+def minify_css(css):
+    """Strip comments and collapse whitespace so each rerun sends a smaller style block."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};])\s*', r'\1', css).strip()
+
+# Minified once at import, so the per-run payload is as small as possible
+THEME_CSS_MIN = minify_css(THEME_CSS)
+
+st.markdown(THEME_CSS_MIN, unsafe_allow_html=True)
 
 # ==============================================================================
 # STATE MANAGEMENT
 # ==============================================================================
 
-if 'pipeline_result' not in st.session_state:
-    st.session_state['pipeline_result'] = None
 if 'escalated_signals' not in st.session_state:
-    st.session_state['escalated_signals'] = []
+    st.session_state['escalated_signals'] = {}  # cluster_id -> ClusterAnalysis
 if 'dismissed_signals' not in st.session_state:
-    st.session_state['dismissed_signals'] = []
+    st.session_state['dismissed_signals'] = {}  # cluster_id -> ClusterAnalysis
+# Only the most recent actions stay in memory; the full trail goes to the AuditLogger CSV
+AUDIT_LOG_RECENT = 100
+
+if 'session_id' not in st.session_state:
+    st.session_state['session_id'] = uuid.uuid4().hex[:8]  # tags this analyst's audit rows
+
 if 'audit_log' not in st.session_state:
-    st.session_state['audit_log'] = []
+    st.session_state['audit_log'] = deque(maxlen=AUDIT_LOG_RECENT)
+if 'audit_counts' not in st.session_state:
+    st.session_state['audit_counts'] = Counter()
+if '_card_cache' not in st.session_state:
+    st.session_state['_card_cache'] = {}
+if '_card_html_cache' not in st.session_state:
+    st.session_state['_card_html_cache'] = {}
+if '_briefing_fallbacks' not in st.session_state:
+    st.session_state['_briefing_fallbacks'] = {}  # cluster_id -> (retry_at, fallback briefing)
+if 'signal_page' not in st.session_state:
+    st.session_state['signal_page'] = 1
+
+# Number of triage cards rendered per "Load more" step
+SIGNAL_PAGE_SIZE = 20
 
 # Department definitions
 DEPARTMENTS = {
@@ -340,60 +420,309 @@ DEPARTMENTS = {
     "Customer Experience": {"icon": "💬", "color": "#10B981", "desc": "Service complaints, sentiment"},
     "Compliance": {"icon": "📋", "color": "#6366F1", "desc": "Regulatory, audit requirements"}
 }
+DEPARTMENT_NAMES = tuple(DEPARTMENTS)
 
 # ==============================================================================
 # DATA LOADING
 # ==============================================================================
 
-@st.cache_data(ttl=60)
-def load_pipeline_data():
-    """Load and process data through the 10-stage pipeline."""
-    try:
-        csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'synthetic_social_signals_mashreq.csv')
-        if not os.path.exists(csv_path):
-            csv_path = 'data/synthetic_social_signals_mashreq.csv'
-        
-        events = load_csv_events(csv_path)
-        
-        # Run Pipeline
-        pipeline = get_pipeline()
-        result = pipeline.process(events)
-        
-        # EMERGENCY BYPASS PROTOCOL Logic Removed from Cached Function
-        
-        return result, events
-    except Exception as e:
-        st.error(f"Pipeline error: {e}")
-        return None, []
+def get_signals_csv_path():
+    """Resolve the synthetic signals CSV, preferring the repo data directory."""
+    csv_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'synthetic_social_signals_mashreq.csv')
+    if not os.path.exists(csv_path):
+        csv_path = 'data/synthetic_social_signals_mashreq.csv'
+    return csv_path
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def load_pipeline_data(csv_path, csv_mtime):
+    """
+    Load and process data through the 10-stage pipeline.
+    `csv_mtime` is only part of the cache key: editing the CSV invalidates the cached run.
+    The result is shared by reference across reruns and sessions, so treat it as read-only.
+    Errors propagate so a failed run is never cached; main() reports them.
+    """
+    events = load_csv_events(csv_path)
+    
+    # Run Pipeline
+    pipeline = get_pipeline()
+    result = pipeline.process(events)
+    
+    # EMERGENCY BYPASS PROTOCOL: only the viral scan is cached here;
+    # escalation itself stays in main() since it mutates session state
+    viral = [a for a in result.cluster_analyses if a.cluster.is_viral]
+    
+    # Triage order is fixed per pipeline run, so sort once here rather than per rerun
+    ranked = sorted(result.cluster_analyses, key=attrgetter('risk_score.total_score'), reverse=True)
+    
+    return result, events, ranked, viral
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def run_simulation_cached(iterations, interest_rate_bps, downtime_minutes, regulatory_fine_mm,
+                          market_volatility_vix, cyber_breach_cost_mm, seed=0):
+    """Run the Monte Carlo simulation, cached on its inputs (seeded so the cache key is pure)."""
+    sim = SimulationEngine(iterations=iterations, seed=seed)
+    return sim.run_simulation(interest_rate_bps, downtime_minutes, regulatory_fine_mm,
+                              market_volatility_vix, cyber_breach_cost_mm)
 
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
+# Risk thresholds are whole numbers, so the integer part of a 0-10 score is
+# enough to index a precomputed lookup table.
+_RISK_LEVEL = ("low",) * 4 + ("medium",) * 2 + ("high",) * 2 + ("critical",) * 3
+_RISK_COLOR = ("#3B82F6",) * 4 + ("#D4AF37",) * 2 + ("#FF5E00",) * 2 + ("#EF4444",) * 3
+
+def _score_index(score):
+    return min(max(int(score), 0), 10)
+
 def get_risk_level(score):
-    if score >= 8: return "critical"
-    if score >= 6: return "high"
-    if score >= 4: return "medium"
-    return "low"
+    return _RISK_LEVEL[_score_index(score)]
 
 def get_risk_color(score):
-    if score >= 8: return "#EF4444"
-    if score >= 6: return "#FF5E00"
-    if score >= 4: return "#D4AF37"
-    return "#3B82F6"
+    return _RISK_COLOR[_score_index(score)]
+
+def get_analyst_card(analysis):
+    """Return the analyst card for an analysis, memoized per cluster in session state."""
+    card_cache = st.session_state['_card_cache']
+    cid = analysis.cluster.cluster_id
+    card = card_cache.get(cid)
+    if card is None:
+        card = card_cache[cid] = analysis.to_analyst_card()
+    return card
 
 def log_action(action, signal_id, user="Risk Analyst", details=""):
     """Log an action to the audit trail."""
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": time.time(),  # formatted only when displayed
         "action": action,
         "signal_id": signal_id,
         "user": user,
         "details": details
     }
     st.session_state['audit_log'].append(entry)
+    st.session_state['audit_counts'][action] += 1
+    
+    # Persist to the immutable audit trail (ISO-timestamped update row per action)
+    get_audit_logger().update_decision(
+        signal_id, action, f"{user} [{st.session_state['session_id']}]", details
+    )
+    
+    # Closed signals no longer render, so drop their cached card
+    if action in ("RESOLVED", "DISMISSED"):
+        st.session_state['_card_cache'].pop(signal_id, None)
+        st.session_state['_card_html_cache'].pop(signal_id, None)
     return entry
 
+# ==============================================================================
+# HTML TEMPLATES
+# ==============================================================================
+
+_HERO_HTML = """
+<div class="hero-header">
+<div class="hero-title">🏦 Mashreq AI Command Center</div>
+<div class="hero-subtitle">Responsible AI Pipeline for Banking Signal Intelligence • Powered by 10-Stage Governance Architecture</div>
+</div>
+"""
+
+_KPI_GRID_TPL = """<div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 1rem;">
+<div class="glass-card" style="text-align: center;">
+<div class="kpi-value">{events}</div>
+<div class="kpi-label">Signals Processed</div>
+</div>
+<div class="glass-card" style="text-align: center;">
+<div class="kpi-value" style="color: #FF5E00;">{active}</div>
+<div class="kpi-label">Requiring Review</div>
+</div>
+<div class="glass-card" style="text-align: center;">
+<div class="kpi-value" style="color: #EF4444;">{critical}</div>
+<div class="kpi-label">Critical Alerts</div>
+</div>
+<div class="glass-card" style="text-align: center;">
+<div class="kpi-value" style="color: #10B981;">✓</div>
+<div class="kpi-label">Governance Validated</div>
+</div>
+</div>"""
+
+_DECISION_BANNER_HTML = """
+<div class="decision-banner">
+<span class="decision-banner-icon">🤖</span>
+<div>
+<div class="decision-banner-text">AI-Assisted Signal Triage</div>
+<div class="decision-banner-sub">Review signals below. AI provides reasoning — you make the decision.</div>
+</div>
+</div>
+"""
+
+_SIGNAL_CARD_TPL = """
+<div class="signal-card {risk_level}">
+<div class="signal-meta" style="margin-bottom: 8px;">{viral_badge}</div>
+<div class="signal-title">{title}</div>
+<div class="signal-meta">
+<span class="score-badge risk-badge {risk_level}">⚠️ Risk: {risk_score}/10</span>
+{ambiguity_badge}
+<span class="score-badge category-badge">📂 {category}</span>
+{consensus_badges}
+</div>
+{keywords_html}
+<div class="ai-reasoning">
+        <div class="ai-reasoning-title">🤖 AI Reasoning</div>
+        <div class="ai-reasoning-text">
+            <span style="font-weight: 600; color: var(--brand-sunrise);">Signal:</span> {signal_text}
+        </div>
+        <div class="ai-reasoning-text" style="margin-top: 8px;">
+            <span style="font-weight: 600; color: var(--brand-sunrise);">Why it matters:</span> {why_matters}
+        </div>
+        <div class="ai-reasoning-text" style="margin-top: 8px;">
+            <span style="font-weight: 600; color: var(--brand-sunrise);">Uncertainty:</span> {uncertainty}
+        </div>
+        {consensus_html}
+    </div>
+</div>
+"""
+
+_CONSENSUS_NOTE_TPL = '''
+<div style="margin-top: 12px; padding: 12px; background: #FFF7ED; border-radius: 8px; border-left: 3px solid #EA580C;">
+    <div style="color: #EA580C; font-weight: 600; font-size: 0.8rem; margin-bottom: 4px;">🤖 Consensus Analysis (NB vs Groq)</div>
+    <div style="color: #6B7280; font-size: 0.85rem;">{notes_text}</div>
+</div>'''
+
+_KEYWORD_BADGE_TPL = '<span style="display: inline-block; padding: 4px 12px; margin: 3px; background: rgba(243, 112, 33, 0.1); border: 1px solid rgba(243, 112, 33, 0.3); border-radius: 20px; font-size: 0.8rem; color: #C2410C; font-weight: 500;">🏷️ {phrase}</span>'
+
+_KEYWORDS_TPL = '''
+<div style="margin-top: 12px; margin-bottom: 12px;">
+    <div style="color: var(--brand-slate); font-size: 0.7rem; font-weight: 600; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">🔑 Key Themes</div>
+    <div style="display: flex; flex-wrap: wrap; gap: 4px;">{keyword_badges}</div>
+</div>'''
+
+_AMBIGUITY_BADGE_TPL = '''<span class="score-badge" style="background: rgba(255,255,255,0.1); border: 1px solid {color}; color: {color};">{text} ({confidence:.0f}%)</span>'''
+
+_SARCASM_BADGE_HTML = '<span class="score-badge" style="background: rgba(245, 158, 11, 0.2); color: #FBBF24; border: 1px solid rgba(245, 158, 11, 0.4);">🎭 Potential Sarcasm</span>'
+
+_CONFLICT_BADGE_HTML = '<span class="score-badge" style="background: rgba(239, 68, 68, 0.2); color: #FCA5A5; border: 1px solid rgba(239, 68, 68, 0.4);">⚠️ Model Conflict</span>'
+
+_VIRAL_BADGE_HTML = '''<span class="score-badge" style="background: rgba(239, 68, 68, 0.2); color: #EF4444; border: 1px solid #EF4444;">🚨 VIRAL: >300% Growth</span>'''
+
+_EXEC_SUMMARY_TPL = """
+<div style="font-size: 1.1rem; font-weight: 700; color: var(--brand-onyx); margin-bottom: 20px;">📈 Activity Overview</div>
+<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px;">
+    <div style="background: var(--risk-low); border: 1px solid rgba(234, 88, 12, 0.2); border-radius: 12px; padding: 20px; text-align: center; box-shadow: var(--shadow-lift);">
+        <div style="font-size: 2.5rem; color: var(--risk-high); font-weight: 800;">{esc}</div>
+        <div style="color: var(--brand-onyx); font-weight: 600;">Signals Escalated</div>
+    </div>
+    <div style="background: var(--bg-card); border: 1px solid var(--brand-cloud); border-radius: 12px; padding: 20px; text-align: center; box-shadow: var(--shadow-lift);">
+        <div style="font-size: 2.5rem; color: var(--brand-slate); font-weight: 800;">{dis}</div>
+        <div style="color: var(--brand-onyx); font-weight: 600;">Signals Dismissed</div>
+    </div>
+    <div style="background: #F0FDF4; border: 1px solid #BBF7D0; border-radius: 12px; padding: 20px; text-align: center; box-shadow: var(--shadow-lift);">
+        <div style="font-size: 2.5rem; color: #15803D; font-weight: 800;">{rou}</div>
+        <div style="color: var(--brand-onyx); font-weight: 600;">Routed to Teams</div>
+    </div>
+</div>
+"""
+
+_AUDIT_ENTRY_TPL = """<div style="background: {bg}; border-left: 4px solid {border}; border-radius: 4px; padding: 16px; margin-bottom: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.05); display: flex; align-items: center; gap: 16px;">
+<div style="font-size: 1.5rem;">{icon}</div>
+<div style="flex-grow: 1;">
+<div style="font-weight: 700; color: var(--brand-onyx);">{action} <span style="font-weight: 400; color: var(--brand-slate);">• {sid}</span></div>
+<div style="color: var(--brand-slate); font-size: 0.9rem;">{details}</div>
+</div>
+<div style="color: var(--brand-slate); font-size: 0.8rem; font-family: monospace; white-space: nowrap;">{ts}</div>
+</div>
+"""
+
+_LED_TPL = """<div class="led-card {status_class}">
+<div class="led-name">{display_name}</div>
+<div style="margin-top: 5px;"><span class="led-dot"></span><span class="led-status">{status}</span></div>
+<div class="led-metrics">{latency}ms • Err: {error_rate:.1f}%</div>
+</div>"""
+
+_CORRELATION_TPL = """<div style="margin-top: 16px; padding: 12px; background: rgba(0,0,0,0.2); border-radius: 8px; border: 1px solid {color}; display: flex; align-items: center; gap: 12px;">
+<div style="font-size: 1.5rem;">{icon}</div>
+<div>
+<div style="color: {color}; font-weight: 700; font-size: 0.9rem; text-transform: uppercase;">{status_text}</div>
+<div style="color: var(--brand-slate); font-size: 0.8rem;">Matched: <span style="color: var(--brand-onyx); font-weight: 600;">{matched_system}</span> ({confidence}%)</div>
+</div>
+</div>"""
+
+# Audit trail entry styling per action type
+_AUDIT_ACTION_STYLES = {
+    "ESCALATED": {"icon": "🚀", "bg": "#FFF7ED", "border": "#F59E0B"},
+    "DISMISSED": {"icon": "🗑️", "bg": "#F9FAFB", "border": "#E5E7EB"},
+    "ROUTED": {"icon": "📤", "bg": "#F0FDF4", "border": "#10B981"},
+    "RESOLVED": {"icon": "✅", "bg": "#F0FDF4", "border": "#10B981"},
+    "CHECK_REGULATORY": {"icon": "📋", "bg": "#EFF6FF", "border": "#3B82F6"},
+    "CHECK_EVIDENCE": {"icon": "🔍", "bg": "#EFF6FF", "border": "#3B82F6"},
+    "RUN_SIMULATION": {"icon": "🎲", "bg": "#FAF5FF", "border": "#8B5CF6"},
+    "CHECK_ETHICS": {"icon": "⚖️", "bg": "#FDF2F8", "border": "#EC4899"}
+}
+_AUDIT_DEFAULT_STYLE = {"icon": "📝", "bg": "#FFFFFF", "border": "#E5E7EB"}
+
+_PERF_GRID_TPL = """<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 12px;">
+<div style="background: #FFF7ED; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #FED7AA;">
+<div style="font-size: 1.2rem; font-weight: 700; color: #EA580C;">{latency}ms</div>
+<div style="font-size: 0.8rem; color: var(--brand-slate);">Latency</div>
+</div>
+<div style="background: #E0F2FE; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #BAE6FD;">
+<div style="font-size: 1.2rem; font-weight: 700; color: #0284C7;">{events}</div>
+<div style="font-size: 0.8rem; color: var(--brand-slate);">Events</div>
+</div>
+<div style="background: #DCFCE7; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #BBF7D0;">
+<div style="font-size: 1.2rem; font-weight: 700; color: #16A34A;">{signals}</div>
+<div style="font-size: 0.8rem; color: var(--brand-slate);">Signals</div>
+</div>
+<div style="background: #F3F4F6; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #E5E7EB;">
+<div style="font-size: 1.2rem; font-weight: 700; color: #4B5563;">{filtered}</div>
+<div style="font-size: 0.8rem; color: var(--brand-slate);">Filtered</div>
+</div>
+</div>"""
+
+_SIM_RESULT_TPL = """<div class="glass-card" style="text-align: center; margin-top: 20px; border-top: 4px solid var(--risk-high);">
+<div style="font-size: 3rem; font-weight: 800; color: {color};">{breach_probability:.1%}</div>
+<div style="color: var(--brand-slate);">Probability of Risk Threshold Breach</div>
+<hr style="border-color: var(--brand-cloud); margin: 20px 0;">
+<div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px; text-align: center;">
+<div>
+<div style="color: var(--brand-sunrise); font-size: 1.5rem; font-weight: 700;">${mean_impact:.1f}M</div>
+<div style="color: var(--brand-slate);">Mean Impact</div>
+</div>
+<div>
+<div style="color: #EA580C; font-size: 1.5rem; font-weight: 700;">${var_95:.1f}M</div>
+<div style="color: var(--brand-slate);">VaR (95%)</div>
+</div>
+</div>
+</div>"""
+
+_DATA_CARD_TPL = """#### 📊 Data Card
+
+<div class="glass-card" style="border-top: 4px solid var(--brand-blue);">
+<h4 style="color: var(--brand-blue);">{dataset_name}</h4>
+<p style="color: var(--brand-slate);">{description}</p>
+<hr style="border-color: var(--brand-cloud);">
+<p><strong>Records:</strong> {total_records}</p>
+<p><strong>PII Handling:</strong> {pii_redaction}</p>
+<p><strong>Synthetic Flag:</strong> ✅ Enabled</p>
+</div>"""
+
+_MODEL_CARD_TPL = """#### 🤖 Model Card
+
+<div class="glass-card" style="border-top: 4px solid var(--brand-sunrise);">
+<h4 style="color: var(--brand-sunrise);">{model_name}</h4>
+<p style="color: var(--brand-slate);">{intended_use}</p>
+<hr style="border-color: var(--brand-cloud);">
+<p><strong>Type:</strong> {model_type}</p>
+<p><strong>Accuracy:</strong> {accuracy:.0%}</p>
+<p><strong>Latency P99:</strong> {latency_p99}</p>
+</div>"""
+
+_CATEGORY_BAR_TPL = """<div style="margin-bottom: 12px;">
+<div style="color: var(--brand-onyx); margin-bottom: 4px; font-weight: 500;">{cat}: {count} signals</div>
+<div class="risk-bar-container" style="background: #E5E7EB;">
+<div class="risk-bar-fill" style="width: {pct}%;"></div>
+</div>
+</div>
+"""
+
 # ==============================================================================
 # RENDER FUNCTIONS
 # ==============================================================================
@@ -401,59 +730,32 @@ def log_action(action, signal_id, user="Risk Analyst", details=""):
 
 def render_hero():
     """Render the hero header."""
-    st.markdown("""
-    <div class="hero-header">
-        <div class="hero-title">🏦 Mashreq AI Command Center</div>
-        <div class="hero-subtitle">Responsible AI Pipeline for Banking Signal Intelligence • Powered by 10-Stage Governance Architecture</div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HERO_HTML, unsafe_allow_html=True)
 
-def render_kpis(result, events):
-    """Render the KPI metrics grid."""
+def render_kpis(result, events, ranked):
+    """Render the KPI metrics grid. `ranked` is the analyses sorted by descending risk."""
     if not result:
         return
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class="glass-card" style="text-align: center;">
-            <div class="kpi-value">{len(events)}</div>
-            <div class="kpi-label">Signals Processed</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        active_count = len([a for a in result.cluster_analyses if a.risk_score.total_score >= 4])
-        st.markdown(f"""
-        <div class="glass-card" style="text-align: center;">
-            <div class="kpi-value" style="color: #FF5E00;">{active_count}</div>
-            <div class="kpi-label">Requiring Review</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        critical_count = len([a for a in result.cluster_analyses if a.risk_score.total_score >= 8])
-        st.markdown(f"""
-        <div class="glass-card" style="text-align: center;">
-            <div class="kpi-value" style="color: #EF4444;">{critical_count}</div>
-            <div class="kpi-label">Critical Alerts</div>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class="glass-card" style="text-align: center;">
-            <div class="kpi-value" style="color: #10B981;">✓</div>
-            <div class="kpi-label">Governance Validated</div>
-        </div>
-        """, unsafe_allow_html=True)
+    # Walk down from the highest risk and stop at the first score below the review threshold
+    active_count = critical_count = 0
+    for a in ranked:
+        score = a.risk_score.total_score
+        if score < 4:
+            break
+        active_count += 1
+        critical_count += score >= 8
+    
+    # One grid instead of four st.columns: the cards are purely visual
+    st.markdown(_KPI_GRID_TPL.format_map({
+        'events': len(events),
+        'active': active_count,
+        'critical': critical_count
+    }), unsafe_allow_html=True)
 
-def render_signal_card(analysis, show_actions=True, key_prefix=""):
-    """Render a single signal card with AI reasoning."""
-    card = analysis.to_analyst_card()
+def build_signal_card_html(card):
+    """Build the HTML for a single signal card with AI reasoning."""
     risk_level = get_risk_level(card['risk_score'])
-    risk_color = get_risk_color(card['risk_score'])
     
     # Extract values
     title = card['title']
@@ -469,93 +771,114 @@ def render_signal_card(analysis, show_actions=True, key_prefix=""):
     has_ambiguity = card.get('has_ambiguity', False)
     consensus_notes = card.get('consensus_notes', [])
     
-    # Get example snippets from cluster
-    example_snippets = card.get('example_snippets', [])
-    
     # Get top phrases/keywords from cluster
     top_phrases = card.get('top_phrases', [])
     
     # Build consensus badges HTML
-    consensus_badges = ""
+    badges = []
     if has_sarcasm:
-        consensus_badges += '<span class="score-badge" style="background: rgba(245, 158, 11, 0.2); color: #FBBF24; border: 1px solid rgba(245, 158, 11, 0.4);">🎭 Potential Sarcasm</span>'
+        badges.append(_SARCASM_BADGE_HTML)
     if has_ambiguity:
-        consensus_badges += '<span class="score-badge" style="background: rgba(239, 68, 68, 0.2); color: #FCA5A5; border: 1px solid rgba(239, 68, 68, 0.4);">⚠️ Model Conflict</span>'
+        badges.append(_CONFLICT_BADGE_HTML)
+    consensus_badges = "".join(badges)
     
     # Build consensus notes HTML
     consensus_html = ""
     if consensus_notes:
-        notes_text = "<br>".join(consensus_notes[:2])
-        consensus_html = f'''
-<div style="margin-top: 12px; padding: 12px; background: #FFF7ED; border-radius: 8px; border-left: 3px solid #EA580C;">
-    <div style="color: #EA580C; font-weight: 600; font-size: 0.8rem; margin-bottom: 4px;">🤖 Consensus Analysis (NB vs Groq)</div>
-    <div style="color: #6B7280; font-size: 0.85rem;">{notes_text}</div>
-</div>'''
+        consensus_html = _CONSENSUS_NOTE_TPL.format(notes_text="<br>".join(consensus_notes[:2]))
     
     # Build keywords/top phrases HTML
     keywords_html = ""
     if top_phrases:
-        keyword_badges = " ".join([
-            f'<span style="display: inline-block; padding: 4px 12px; margin: 3px; background: rgba(243, 112, 33, 0.1); border: 1px solid rgba(243, 112, 33, 0.3); border-radius: 20px; font-size: 0.8rem; color: #C2410C; font-weight: 500;">🏷️ {phrase}</span>'
-            for phrase in top_phrases[:6]  # Show max 6 keywords
-        ])
-        keywords_html = f'''
-<div style="margin-top: 12px; margin-bottom: 12px;">
-    <div style="color: var(--brand-slate); font-size: 0.7rem; font-weight: 600; text-transform: uppercase; letter-spacing: 1px; margin-bottom: 8px;">🔑 Key Themes</div>
-    <div style="display: flex; flex-wrap: wrap; gap: 4px;">{keyword_badges}</div>
-</div>'''
+        keyword_badges = " ".join(_KEYWORD_BADGE_TPL.format(phrase=phrase) for phrase in top_phrases[:6])  # Show max 6 keywords
+        keywords_html = _KEYWORDS_TPL.format(keyword_badges=keyword_badges)
     
     # Strategic Ambiguity Gauge
     ambiguity = card.get('ambiguity_status', {'level': 'HIGH', 'color': 'green', 'text': 'High Confidence'})
-    ambiguity_badge = f'''<span class="score-badge" style="background: rgba(255,255,255,0.1); border: 1px solid {ambiguity['color']}; color: {ambiguity['color']};">{ambiguity['text']} ({confidence:.0f}%)</span>'''
+    ambiguity_badge = _AMBIGUITY_BADGE_TPL.format(color=ambiguity['color'], text=ambiguity['text'], confidence=confidence)
 
     # Viral Badge
-    viral_badge = ""
-    is_viral = card.get('is_viral', False)
-    if is_viral:
-        viral_badge = '''<span class="score-badge" style="background: rgba(239, 68, 68, 0.2); color: #EF4444; border: 1px solid #EF4444; animation: pulse 2s infinite;">🚨 VIRAL: >300% Growth</span>'''
+    viral_badge = _VIRAL_BADGE_HTML if card['is_viral'] else ""
     
     # Card container with badges
-    st.markdown(f"""
-<div class="signal-card {risk_level}">
-<div class="signal-meta" style="margin-bottom: 8px;">{viral_badge}</div>
-<div class="signal-title">{title}</div>
-<div class="signal-meta">
-<span class="score-badge risk-badge {risk_level}">⚠️ Risk: {risk_score}/10</span>
-{ambiguity_badge}
-<span class="score-badge category-badge">📂 {category}</span>
-{consensus_badges}
-</div>
-{keywords_html}
-<div class="ai-reasoning">
-        <div class="ai-reasoning-title">🤖 AI Reasoning</div>
-        <div class="ai-reasoning-text">
-            <span style="font-weight: 600; color: var(--brand-sunrise);">Signal:</span> {signal_text}
-        </div>
-        <div class="ai-reasoning-text" style="margin-top: 8px;">
-            <span style="font-weight: 600; color: var(--brand-sunrise);">Why it matters:</span> {why_matters}
-        </div>
-        <div class="ai-reasoning-text" style="margin-top: 8px;">
-            <span style="font-weight: 600; color: var(--brand-sunrise);">Uncertainty:</span> {uncertainty}
-        </div>
-        {consensus_html}
-    </div>
-</div>
-""", unsafe_allow_html=True)
+    return _SIGNAL_CARD_TPL.format_map({
+        'risk_level': risk_level,
+        'viral_badge': viral_badge,
+        'title': title,
+        'risk_score': risk_score,
+        'ambiguity_badge': ambiguity_badge,
+        'category': category,
+        'consensus_badges': consensus_badges,
+        'keywords_html': keywords_html,
+        'signal_text': signal_text,
+        'why_matters': why_matters,
+        'uncertainty': uncertainty,
+        'consensus_html': consensus_html,
+    })
 
+def _escalate_signal(analysis):
+    """Button callback: move a signal to the Escalation Hub."""
+    cid = analysis.cluster.cluster_id
+    st.session_state['escalated_signals'][cid] = analysis
+    log_action("ESCALATED", cid)
+
+def _dismiss_signal(analysis):
+    """Button callback: dismiss a signal from triage."""
+    cid = analysis.cluster.cluster_id
+    st.session_state['dismissed_signals'][cid] = analysis
+    log_action("DISMISSED", cid)
+
+def _load_more_signals():
+    """Button callback: reveal the next page of triage cards."""
+    st.session_state['signal_page'] += 1
+
+def get_signal_card_html(card):
+    """Return the signal card HTML, memoized per cluster alongside the analyst card."""
+    html_cache = st.session_state['_card_html_cache']
+    cid = card['cluster_id']
+    html = html_cache.get(cid)
+    if html is None:
+        html = html_cache[cid] = build_signal_card_html(card)
+    return html
+
+def render_signal_cards_batch(analyses, show_actions=True, key_prefix=""):
+    """
+    Render a list of signal cards with a single st.markdown call.
+    Buttons cannot live inside raw HTML, so the actions follow as one row per signal
+    (escalate labelled with the signal, dismiss beside it) below the cards.
+    """
+    cards = [get_analyst_card(a) for a in analyses]
+    st.markdown("".join([get_signal_card_html(card) for card in cards]), unsafe_allow_html=True)
     
     if show_actions:
-        col1, col2, col3 = st.columns([2, 1, 4])
-        with col1:
-            if st.button("🚀 Escalate", key=f"{key_prefix}_escalate_{card['cluster_id']}", type="primary"):
-                st.session_state['escalated_signals'].append(analysis)
-                log_action("ESCALATED", card['cluster_id'])
-                st.rerun()
-        with col2:
-            if st.button("🗑️ Dismiss", key=f"{key_prefix}_dismiss_{card['cluster_id']}"):
-                st.session_state['dismissed_signals'].append(analysis)
-                log_action("DISMISSED", card['cluster_id'])
-                st.rerun()
+        st.markdown("###### ⚡ Actions")
+        render_signal_action_grid(analyses, cards, key_prefix)
+
+@st.fragment
+def render_signal_action_grid(analyses, cards, key_prefix=""):
+    """
+    Escalate / Dismiss grid for the triage batch. As a fragment, a click reruns only this
+    grid; decided rows turn into disabled buttons and the card list catches up on the next
+    full run. Each signal gets its own row so a Dismiss always sits beside its own Escalate.
+    """
+    escalated = st.session_state['escalated_signals']
+    dismissed = st.session_state['dismissed_signals']
+    for analysis, card in zip(analyses, cards):
+        cid = card['cluster_id']
+        label = f"{card['title']} • Risk {card['risk_score']}/10"
+        decided = cid in escalated or cid in dismissed
+        if decided:
+            outcome = "✅ Escalated" if cid in escalated else "🗑️ Dismissed"
+            label = f"{outcome} • {label}"
+        else:
+            label = f"🚀 Escalate • {label}"
+        col_escalate, col_dismiss = st.columns([4, 1])
+        col_escalate.button(label, key=f"{key_prefix}_escalate_{cid}", type="primary",
+                            use_container_width=True, disabled=decided,
+                            on_click=_escalate_signal, args=(analysis,))
+        col_dismiss.button("🗑️ Dismiss", key=f"{key_prefix}_dismiss_{cid}",
+                           use_container_width=True, disabled=decided,
+                           on_click=_dismiss_signal, args=(analysis,))
 
 # ==============================================================================
 # COMMAND CENTER LOGIC
@@ -563,46 +886,86 @@ def render_signal_card(analysis, show_actions=True, key_prefix=""):
 
 from telemetry_engine import get_telemetry_engine, SystemStatus
 
-def render_system_health_leds(health_data):
-    """Render LED indicators for internal systems."""
-    cols = st.columns(4)
-    for idx, (name, sys) in enumerate(health_data.items()):
-        color = "#10B981" # Green
-        animate = ""
-        if sys.status == SystemStatus.CRITICAL:
-            color = "#EF4444" # Red
-            animate = "blink"
-        elif sys.status == SystemStatus.LATENT:
-            color = "#F59E0B" # Yellow
-        
-        display_name = name.replace("_", " ").replace("Core", "").strip()
-        
-        with cols[idx]:
-            st.markdown(f"""
-            <div style="background: var(--bg-card); border-radius: 10px; padding: 10px; text-align: center; border: 1px solid var(--brand-cloud); box-shadow: var(--shadow-lift);">
-                <div style="font-size: 0.7rem; color: var(--brand-slate); text-transform: uppercase;">{display_name}</div>
-                <div style="margin-top: 5px;">
-                    <span style="
-                        height: 12px; 
-                        width: 12px; 
-                        background-color: {color}; 
-                        border-radius: 50%; 
-                        display: inline-block;
-                        box-shadow: 0 0 5px {color};
-                    "></span>
-                    <span style="font-size: 0.8rem; font-weight: 700; color: {color}; margin-left: 5px;">
-                        {sys.status.value}
-                    </span>
-                </div>
-                <div style="font-size: 0.65rem; color: var(--brand-slate); margin-top: 2px;">
-                    {sys.latency_ms}ms • Err: {sys.error_rate:.1f}%
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def cached_executive_briefing(cluster_id, title, category, why_it_matters):
+    """
+    LLM executive briefing, generated once per incident and shared across reruns and sessions.
+    LLM errors propagate, so st.cache_data never stores a fallback briefing.
+    """
+    return get_telemetry_engine().generate_executive_briefing({
+        'title': title,
+        'category': category,
+        'rationale': {'why_it_matters': why_it_matters}
+    }, raise_errors=True)
+
+# After a failed LLM briefing, reuse the fallback for this long before calling the LLM again
+BRIEFING_RETRY_SECONDS = 180
+
+def get_executive_briefing(card):
+    """
+    Cached briefing for a card, or the template fallback if the LLM call fails.
+    Fallbacks are kept per incident in session state (never in the shared cache)
+    and only retried after BRIEFING_RETRY_SECONDS, so reruns don't hammer a rate-limited LLM.
+    """
+    cid = card['cluster_id']
+    fallbacks = st.session_state['_briefing_fallbacks']
+    failed = fallbacks.get(cid)
+    if failed is not None and time.time() < failed[0]:
+        return failed[1]
+    
+    why_it_matters = card['rationale'].get('why_it_matters', 'Unknown')
+    try:
+        briefing = cached_executive_briefing(cid, card['title'], card['category'], why_it_matters)
+    except Exception as e:
+        briefing = get_telemetry_engine().fallback_briefing(card, e)
+        fallbacks[cid] = (time.time() + BRIEFING_RETRY_SECONDS, briefing)
+        return briefing
+    fallbacks.pop(cid, None)
+    return briefing
+
+@st.cache_data(ttl=5, show_spinner=False)
+def cached_system_health():
+    """System health snapshot, refreshed at most every few seconds rather than on every click."""
+    return get_telemetry_engine().get_system_health()
+
+# LED colour class per system status (anything else renders green)
+_LED_CLASSES = {
+    SystemStatus.CRITICAL: "led-critical",
+    SystemStatus.LATENT: "led-latent",
+}
+
+def build_system_health_leds_html(health_data):
+    """Build the LED indicators for internal systems as one CSS grid."""
+    leds = "".join([
+        _LED_TPL.format(
+            status_class=_LED_CLASSES.get(sys.status, "led-healthy"),
+            display_name=name.replace("_", " ").replace("Core", "").strip(),
+            status=sys.status.value,
+            latency=sys.latency_ms,
+            error_rate=sys.error_rate
+        )
+        for name, sys in health_data.items()
+    ])
+    return f'<div class="led-grid">{leds}</div>'
 
+# Mandatory Decision Support steps before an incident can be resolved
+WORKFLOW_STEPS = ("1. Compliance", "2. Evidence", "3. Impact", "4. Ethics")
+WORKFLOW_STEP_COUNT = len(WORKFLOW_STEPS)
+
+def complete_workflow_step(workflow, step):
+    """Mark a workflow step done and keep the completed-step counter in sync."""
+    if not workflow[step]:
+        workflow[step] = True
+        workflow['_count'] += 1
+
+@st.fragment
 def render_escalation_card(analysis):
-    """Render an escalated signal with Command Center Telemetry & Decision Support."""
-    card = analysis.to_analyst_card()
+    """
+    Render an escalated signal with Command Center Telemetry & Decision Support.
+    Runs as a fragment: workflow checks, simulation and routing rerun only this card;
+    resolving still triggers a full app rerun to drop the card from the hub.
+    """
+    card = get_analyst_card(analysis)
     cluster_id = card['cluster_id']
     
     # Initialize Workflow State
@@ -614,30 +977,27 @@ def render_escalation_card(analysis):
             'regulatory': False,
             'evidence': False,
             'impact': False,
-            'ethics': False
+            'ethics': False,
+            '_count': 0  # Completed steps, maintained by complete_workflow_step()
         }
     
     workflow = st.session_state['incident_workflows'][cluster_id]
     
     # Initialize Engines
     telemetry = get_telemetry_engine()
-    shield = GovernanceShield()
+    shield = get_governance_shield()
     plan = shield.get_internal_action_plan(card)
     
-    # Get Telemetry Data
-    health_data = telemetry.get_system_health()
-    correlation = telemetry.correlate_signal(card['category'], card['rationale']['what_signal'])
-    
-    # Generate Briefing
-    briefing_key = f"briefing_{cluster_id}"
-    if briefing_key not in st.session_state:
-        st.session_state[briefing_key] = telemetry.generate_executive_briefing(card)
-    briefing = st.session_state[briefing_key]
+    # Get Telemetry Data + Briefing (both served from st.cache_data)
+    briefing = get_executive_briefing(card)
+    snapshot = telemetry.get_incident_snapshot(card, briefing=briefing, health=cached_system_health())
+    health_data, correlation, briefing = snapshot.health, snapshot.correlation, snapshot.briefing
 
     # --- UI RENDER START ---
     
-    # Header
+    # Header (the leading rule separates consecutive cards in the hub without a separate st.divider)
     st.markdown(f"""
+    <hr style="border: none; border-top: 1px solid var(--brand-cloud); margin: 24px 0;">
     <div style="border-left: 4px solid #F37021; padding-left: 16px; margin-bottom: 20px;">
         <div style="font-size: 1.5rem; font-weight: 700; color: var(--brand-onyx);">🚨 INCIDENT: {card['title']}</div>
         <div style="color: var(--brand-slate); font-family: monospace; font-weight: 500;">ID: {cluster_id} • RISK SCORE: {card['risk_score']}/10</div>
@@ -650,22 +1010,18 @@ def render_escalation_card(analysis):
     with col1:
         # LIVE TELEMETRY SHADOW
         with st.container(border=True):
-            st.markdown("#### 📡 Telemetry Shadow")
-            render_system_health_leds(health_data)
-            
             # Correlation
             corr_color = "#EF4444" if correlation.is_confirmed else "#F59E0B"
             if not correlation.action_required: corr_color = "#10B981"
             
-            st.markdown(f"""
-            <div style="margin-top: 16px; padding: 12px; background: rgba(0,0,0,0.2); border-radius: 8px; border: 1px solid {corr_color}; display: flex; align-items: center; gap: 12px;">
-                <div style="font-size: 1.5rem;">{'✅' if correlation.action_required else '📉'}</div>
-                <div>
-                    <div style="color: {corr_color}; font-weight: 700; font-size: 0.9rem; text-transform: uppercase;">{correlation.status_text}</div>
-                    <div style="color: var(--brand-slate); font-size: 0.8rem;">Matched: <span style="color: var(--brand-onyx); font-weight: 600;">{correlation.matched_system}</span> ({correlation.confidence_score}%)</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            # Heading, LEDs and correlation banner go out as one markdown block
+            st.markdown("#### 📡 Telemetry Shadow\n\n" + build_system_health_leds_html(health_data) + _CORRELATION_TPL.format(
+                color=corr_color,
+                icon='✅' if correlation.action_required else '📉',
+                status_text=correlation.status_text,
+                matched_system=correlation.matched_system,
+                confidence=correlation.confidence_score
+            ), unsafe_allow_html=True)
 
         # EXECUTIVE BRIEFING
         st.markdown("#### 📋 Executive Briefing")
@@ -675,11 +1031,12 @@ def render_escalation_card(analysis):
     with col2:
         st.markdown("#### 🛡️ Decision Support System")
         
-        # Tabs for 4-Step Workflow
-        t1, t2, t3, t4 = st.tabs(["1. Compliance", "2. Evidence", "3. Impact", "4. Ethics"])
+        # 4-Step Workflow: a radio renders only the selected step's widgets (st.tabs builds all four)
+        step = st.radio("Workflow step", WORKFLOW_STEPS, horizontal=True,
+                        key=f"wk_step_{cluster_id}", label_visibility="collapsed")
         
         # TAB 1: REGULATORY COMPLIANCE
-        with t1:
+        if step == WORKFLOW_STEPS[0]:
             st.markdown("**Regulatory Protocol Check**")
             if 'Senior' in plan['escalation_target']:
                  st.error(f"⚠️ Mandatory Escalation: {plan['escalation_target']}")
@@ -688,39 +1045,33 @@ def render_escalation_card(analysis):
             
             if st.checkbox("✅ I have reviewed the CBUAE compliance protocols.", value=workflow['regulatory'], key=f"wk_reg_{cluster_id}"):
                 if not workflow['regulatory']:
-                    workflow['regulatory'] = True
+                    complete_workflow_step(workflow, 'regulatory')
                     log_action("CHECK_REGULATORY", cluster_id, details="Analyst reviewed CBUAE protocols")
-                    st.rerun()
         
         # TAB 2: INTERNAL EVIDENCE
-        with t2:
-            st.markdown("**Internal Evidence Corroboration**")
-            st.markdown(f"*{plan['internal_evidence']}*")
+        elif step == WORKFLOW_STEPS[1]:
+            st.markdown(f"**Internal Evidence Corroboration**\n\n*{plan['internal_evidence']}*")
             
             # Show specific telemetry snapshot integration hint
             st.caption(f"System Status: {correlation.matched_system} is {health_data.get(correlation.matched_system, 'UNKNOWN')}")
             
             if st.checkbox("✅ Internal evidence gathered and logged.", value=workflow['evidence'], key=f"wk_ev_{cluster_id}"):
                 if not workflow['evidence']:
-                    workflow['evidence'] = True
+                    complete_workflow_step(workflow, 'evidence')
                     log_action("CHECK_EVIDENCE", cluster_id, details="Internal telemetry corroborated")
-                    st.rerun()
 
         # TAB 3: FINANCIAL IMPACT (Monte Carlo)
-        with t3:
-            st.markdown("**Financial Stress Test (VaR)**")
-            st.markdown(f"*{plan['stress_test']}*")
+        elif step == WORKFLOW_STEPS[2]:
+            st.markdown(f"**Financial Stress Test (VaR)**\n\n*{plan['stress_test']}*")
             
             if st.button("🎲 Run Crisis Simulation", key=f"wk_sim_{cluster_id}"):
                 with st.spinner("Calculating Value at Risk..."):
-                    sim = SimulationEngine(iterations=2000)
-                    res = sim.run_simulation(25, 60, 2.0, 30, 5.0) # Base params
+                    res = run_simulation_cached(2000, 25, 60, 2.0, 30, 5.0) # Base params
                     st.session_state[f"sim_res_{cluster_id}"] = res
                     # Auto-check upon running sim
                     if not workflow['impact']:
-                        workflow['impact'] = True
+                        complete_workflow_step(workflow, 'impact')
                         log_action("RUN_SIMULATION", cluster_id, details=f"VaR: ${res['var_95']:.2f}M")
-                        st.rerun()
 
             if f"sim_res_{cluster_id}" in st.session_state:
                 res = st.session_state[f"sim_res_{cluster_id}"]
@@ -741,33 +1092,35 @@ def render_escalation_card(analysis):
                  if workflow['impact']: st.success("✅ Risk Assessment Complete")
 
         # TAB 4: ETHICS & BIAS
-        with t4:
-            st.markdown("**Ethical Guardrail Review**")
-            st.markdown(f"*{plan['bias_review']}*")
+        elif step == WORKFLOW_STEPS[3]:
+            st.markdown(f"**Ethical Guardrail Review**\n\n*{plan['bias_review']}*")
             st.info("Ensure response strategy targets behavioral patterns, not demographics.")
             
             if st.checkbox("✅ No bias detected in signal or response plan.", value=workflow['ethics'], key=f"wk_eth_{cluster_id}"):
                  if not workflow['ethics']:
-                    workflow['ethics'] = True
+                    complete_workflow_step(workflow, 'ethics')
                     log_action("CHECK_ETHICS", cluster_id, details="Bias review signed off")
-                    st.rerun()
 
         st.divider()
         
         # COMPLETE WORKFLOW Check
-        steps_complete = all(workflow.values())
+        steps_complete = workflow['_count'] == WORKFLOW_STEP_COUNT
         
         # Routing & Resolution
         c_route, c_resolve = st.columns([2, 1])
         
         with c_route:
             st.markdown("###### 📤 Dept Routing")
-            dept_cols = st.columns(2)
-            for idx, (dept, info) in enumerate(DEPARTMENTS.items()):
-                with dept_cols[idx % 2]:
-                     if st.button(f"{info['icon']} {dept}", key=f"rt_{cluster_id}_{dept}", use_container_width=True):
-                        log_action("ROUTED", cluster_id, details=f"Routed to {dept}")
-                        st.toast(f"Routed to {dept}")
+            dept = st.selectbox(
+                "Route to",
+                DEPARTMENT_NAMES,
+                key=f"rt_sel_{cluster_id}",
+                format_func=lambda d: f"{DEPARTMENTS[d]['icon']} {d}",
+                label_visibility="collapsed"
+            )
+            if st.button("📤 Route", key=f"rt_btn_{cluster_id}", use_container_width=True):
+                log_action("ROUTED", cluster_id, details=f"Routed to {dept}")
+                st.toast(f"Routed to {dept}")
 
         with c_resolve:
             st.markdown("###### ✅ Resolution")
@@ -784,8 +1137,13 @@ def render_escalation_card(analysis):
             
             if resolve_btn:
                 log_action("RESOLVED", cluster_id, details="Mandatory workflow passed")
-                st.session_state['escalated_signals'].remove(analysis)
-                st.success("Incident Resolved")
+                st.session_state['escalated_signals'].pop(cluster_id, None)
+                
+                # Release per-incident state tied to the escalation's lifetime
+                st.session_state.pop(f"sim_res_{cluster_id}", None)
+                st.session_state['incident_workflows'].pop(cluster_id, None)
+                # A toast survives the app rerun that drops this card (st.success would not)
+                st.toast(f"Incident {cluster_id} resolved", icon="✅")
                 st.rerun()
 
 def render_audit_log():
@@ -794,38 +1152,12 @@ def render_audit_log():
     
     # Executive Summary
     # Executive Summary Cards
-    total_escalated = len([e for e in st.session_state['audit_log'] if e['action'] == 'ESCALATED'])
-    total_dismissed = len([e for e in st.session_state['audit_log'] if e['action'] == 'DISMISSED'])
-    total_routed = len([e for e in st.session_state['audit_log'] if e['action'] == 'ROUTED'])
-    st.markdown("""
-    <div style="font-size: 1.1rem; font-weight: 700; color: var(--brand-onyx); margin-bottom: 20px;">📈 Activity Overview</div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown(f"""
-        <div style="background: var(--risk-low); border: 1px solid rgba(234, 88, 12, 0.2); border-radius: 12px; padding: 20px; text-align: center; box-shadow: var(--shadow-lift);">
-            <div style="font-size: 2.5rem; color: var(--risk-high); font-weight: 800;">{total_escalated}</div>
-            <div style="color: var(--brand-onyx); font-weight: 600;">Signals Escalated</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col2:
-        st.markdown(f"""
-        <div style="background: var(--bg-card); border: 1px solid var(--brand-cloud); border-radius: 12px; padding: 20px; text-align: center; box-shadow: var(--shadow-lift);">
-            <div style="font-size: 2.5rem; color: var(--brand-slate); font-weight: 800;">{total_dismissed}</div>
-            <div style="color: var(--brand-onyx); font-weight: 600;">Signals Dismissed</div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-    with col3:
-        st.markdown(f"""
-        <div style="background: #F0FDF4; border: 1px solid #BBF7D0; border-radius: 12px; padding: 20px; text-align: center; box-shadow: var(--shadow-lift);">
-            <div style="font-size: 2.5rem; color: #15803D; font-weight: 800;">{total_routed}</div>
-            <div style="color: var(--brand-onyx); font-weight: 600;">Routed to Teams</div>
-        </div>
-        """, unsafe_allow_html=True)
+    log = st.session_state['audit_log']
+    counts = st.session_state['audit_counts']
+    total_escalated = counts['ESCALATED']
+    total_dismissed = counts['DISMISSED']
+    total_routed = counts['ROUTED']
+    st.markdown(_EXEC_SUMMARY_TPL.format(esc=total_escalated, dis=total_dismissed, rou=total_routed), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -844,54 +1176,31 @@ def render_audit_log():
     
     # Detailed Log
     st.markdown("### 📝 Recent Actions")
-    if not st.session_state['audit_log']:
+    if not log:
         st.info("No actions recorded yet. Start reviewing signals to populate the audit trail.")
     else:
-        for entry in reversed(st.session_state['audit_log'][-20:]):
-            action_map = {
-                "ESCALATED": {"icon": "🚀", "bg": "#FFF7ED", "border": "#F59E0B"},
-                "DISMISSED": {"icon": "🗑️", "bg": "#F9FAFB", "border": "#E5E7EB"},
-                "ROUTED": {"icon": "📤", "bg": "#F0FDF4", "border": "#10B981"},
-                "RESOLVED": {"icon": "✅", "bg": "#F0FDF4", "border": "#10B981"},
-                "CHECK_REGULATORY": {"icon": "📋", "bg": "#EFF6FF", "border": "#3B82F6"},
-                "CHECK_EVIDENCE": {"icon": "🔍", "bg": "#EFF6FF", "border": "#3B82F6"},
-                "RUN_SIMULATION": {"icon": "🎲", "bg": "#FAF5FF", "border": "#8B5CF6"},
-                "CHECK_ETHICS": {"icon": "⚖️", "bg": "#FDF2F8", "border": "#EC4899"}
-            }
-            
-            act = entry['action']
-            style = action_map.get(act, {"icon": "📝", "bg": "#FFFFFF", "border": "#E5E7EB"})
-            
-            st.markdown(f"""
-            <div style="
-                background: {style['bg']}; 
-                border-left: 4px solid {style['border']}; 
-                border-radius: 4px; 
-                padding: 16px; 
-                margin-bottom: 12px;
-                box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-                display: flex;
-                align-items: center;
-                gap: 16px;
-            ">
-                <div style="font-size: 1.5rem;">{style['icon']}</div>
-                <div style="flex-grow: 1;">
-                    <div style="font-weight: 700; color: var(--brand-onyx);">{entry['action']} <span style="font-weight: 400; color: var(--brand-slate);">• {entry['signal_id']}</span></div>
-                    <div style="color: var(--brand-slate); font-size: 0.9rem;">{entry.get('details', '')}</div>
-                </div>
-                <div style="color: var(--brand-slate); font-size: 0.8rem; font-family: monospace; white-space: nowrap;">
-                    {entry['timestamp'][11:19]}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-def generate_management_report():
-    """Generate a markdown report for upper management."""
-    now = datetime.now()
-    
-    report = f"""# AI Command Center - Executive Report
-Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}
+        shown = 20
+        if len(log) > shown:
+            shown = st.slider("Show last N actions", 10, len(log), shown, key="audit_show_last")
+        
+        # One markdown call for the whole list instead of one per entry
+        parts = []
+        for entry in islice(reversed(log), shown):
+            style = _AUDIT_ACTION_STYLES.get(entry['action'], _AUDIT_DEFAULT_STYLE)
+            parts.append(_AUDIT_ENTRY_TPL.format(
+                bg=style['bg'],
+                border=style['border'],
+                icon=style['icon'],
+                action=entry['action'],
+                sid=entry['signal_id'],
+                details=entry.get('details', ''),
+                ts=time.strftime('%H:%M:%S', time.localtime(entry['timestamp']))
+            ))
+        # Fixed-height scroll box keeps the page layout constant however many entries are shown
+        with st.container(height=400, border=False):
+            st.markdown("".join(parts), unsafe_allow_html=True)
 
+_REPORT_BODY_TPL = """
 ## Summary
 
 This report summarizes AI-assisted signal triage activities from the Mashreq Responsible AI Pipeline.
@@ -900,9 +1209,9 @@ This report summarizes AI-assisted signal triage activities from the Mashreq Res
 
 | Metric | Count |
 |--------|-------|
-| Signals Escalated | {len([e for e in st.session_state['audit_log'] if e['action'] == 'ESCALATED'])} |
-| Signals Dismissed | {len([e for e in st.session_state['audit_log'] if e['action'] == 'DISMISSED'])} |
-| Team Routings | {len([e for e in st.session_state['audit_log'] if e['action'] == 'ROUTED'])} |
+| Signals Escalated | {escalated} |
+| Signals Dismissed | {dismissed} |
+| Team Routings | {routed} |
 
 ### Governance Compliance
 
@@ -913,16 +1222,52 @@ This report summarizes AI-assisted signal triage activities from the Mashreq Res
 
 ### Activity Timeline
 
-"""
-    for entry in st.session_state['audit_log'][-10:]:
-        report += f"- **{entry['timestamp'][:19]}**: {entry['action']} - Signal {entry['signal_id']} {entry.get('details', '')}\n"
-    
-    report += """
+{timeline}
 
 ---
 *This report was generated by the Mashreq AI Command Center. All AI recommendations require human approval.*
 """
-    return report
+
+_REPORT_ENTRY_TPL = "- **{ts}**: {action} - Signal {signal_id} {details}\n"
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _build_report(totals, log_snapshot):
+    """
+    Build the management report body from (escalated, dismissed, routed) totals and an
+    immutable (timestamp, action, signal_id, details) snapshot of recent entries.
+    """
+    escalated, dismissed, routed = totals
+    timeline = "".join([
+        _REPORT_ENTRY_TPL.format(
+            ts=datetime.fromtimestamp(timestamp).isoformat(timespec='seconds'),
+            action=action, signal_id=signal_id, details=details
+        )
+        for timestamp, action, signal_id, details in log_snapshot
+    ])
+    return _REPORT_BODY_TPL.format(escalated=escalated, dismissed=dismissed, routed=routed, timeline=timeline)
+
+def generate_management_report():
+    """Generate a markdown report for upper management (cached until the audit log changes)."""
+    counts = st.session_state['audit_counts']
+    totals = (counts['ESCALATED'], counts['DISMISSED'], counts['ROUTED'])
+    recent = list(st.session_state['audit_log'])[-10:]
+    log_snapshot = tuple((e['timestamp'], e['action'], e['signal_id'], e.get('details', '')) for e in recent)
+    # The header carries the generation time, so it stays outside the cached body
+    header = f"# AI Command Center - Executive Report\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+    return header + _build_report(totals, log_snapshot)
+
+@st.cache_resource
+def load_json_card(filename):
+    """Load a static JSON card from the data directory once per process."""
+    candidates = (
+        os.path.join(os.path.dirname(__file__), '..', 'data', filename),
+        os.path.join('data', filename),
+    )
+    for path in candidates:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                return json.load(f)
+    raise FileNotFoundError(f"{filename} not found")
 
 def render_governance_center():
     """Render the governance and compliance tab."""
@@ -931,47 +1276,32 @@ def render_governance_center():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("#### 📊 Data Card")
         try:
-            data_card_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'data_card.json')
-            if not os.path.exists(data_card_path):
-                data_card_path = 'data/data_card.json'
-            with open(data_card_path, 'r') as f:
-                data_card = json.load(f)
+            data_card = load_json_card('data_card.json')
             
-            st.markdown(f"""
-            <div class="glass-card" style="border-top: 4px solid var(--brand-blue);">
-                <h4 style="color: var(--brand-blue);">{data_card['dataset_name']}</h4>
-                <p style="color: var(--brand-slate);">{data_card['description']}</p>
-                <hr style="border-color: var(--brand-cloud);">
-                <p><strong>Records:</strong> {data_card['composition']['total_records']}</p>
-                <p><strong>PII Handling:</strong> {data_card['governance']['pii_redaction']}</p>
-                <p><strong>Synthetic Flag:</strong> ✅ Enabled</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_DATA_CARD_TPL.format_map({
+                'dataset_name': data_card['dataset_name'],
+                'description': data_card['description'],
+                'total_records': data_card['composition']['total_records'],
+                'pii_redaction': data_card['governance']['pii_redaction']
+            }), unsafe_allow_html=True)
         except:
+            st.markdown("#### 📊 Data Card")
             st.warning("Data card not found")
     
     with col2:
-        st.markdown("#### 🤖 Model Card")
         try:
-            model_card_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'model_card.json')
-            if not os.path.exists(model_card_path):
-                model_card_path = 'data/model_card.json'
-            with open(model_card_path, 'r') as f:
-                model_card = json.load(f)
+            model_card = load_json_card('model_card.json')
             
-            st.markdown(f"""
-            <div class="glass-card" style="border-top: 4px solid var(--brand-sunrise);">
-                <h4 style="color: var(--brand-sunrise);">{model_card['model_name']}</h4>
-                <p style="color: var(--brand-slate);">{model_card['intended_use']}</p>
-                <hr style="border-color: var(--brand-cloud);">
-                <p><strong>Type:</strong> {model_card['model_type']}</p>
-                <p><strong>Accuracy:</strong> {model_card['performance_metrics']['accuracy']:.0%}</p>
-                <p><strong>Latency P99:</strong> {model_card['performance_metrics']['latency_p99']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_MODEL_CARD_TPL.format_map({
+                'model_name': model_card['model_name'],
+                'intended_use': model_card['intended_use'],
+                'model_type': model_card['model_type'],
+                'accuracy': model_card['performance_metrics']['accuracy'],
+                'latency_p99': model_card['performance_metrics']['latency_p99']
+            }), unsafe_allow_html=True)
         except:
+            st.markdown("#### 🤖 Model Card")
             st.warning("Model card not found")
     
     # Policy Display
@@ -981,6 +1311,15 @@ def render_governance_center():
     with st.expander("View Full Policy", expanded=False):
         st.markdown(guardrails.get_policy_text())
 
+@st.cache_data(show_spinner=False)
+def build_category_bars_html(dist_items):
+    """Category distribution bars, cached on the (category, count) pairs."""
+    total = sum(count for _, count in dist_items) or 1
+    return "".join([
+        _CATEGORY_BAR_TPL.format(cat=cat, count=count, pct=count * 100.0 / total)
+        for cat, count in dist_items
+    ])
+
 def render_analytics_tab(result, events):
     """Render the analytics and simulation tab."""
     st.markdown("### 📈 Pipeline Analytics")
@@ -993,45 +1332,20 @@ def render_analytics_tab(result, events):
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown("#### ⚡ Pipeline Performance")
-        st.markdown(f"""
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 12px;">
-            <div style="background: #FFF7ED; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #FED7AA;">
-                <div style="font-size: 1.2rem; font-weight: 700; color: #EA580C;">{result.processing_time_ms}ms</div>
-                <div style="font-size: 0.8rem; color: var(--brand-slate);">Latency</div>
-            </div>
-            <div style="background: #E0F2FE; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #BAE6FD;">
-                <div style="font-size: 1.2rem; font-weight: 700; color: #0284C7;">{len(events)}</div>
-                <div style="font-size: 0.8rem; color: var(--brand-slate);">Events</div>
-            </div>
-            <div style="background: #DCFCE7; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #BBF7D0;">
-                <div style="font-size: 1.2rem; font-weight: 700; color: #16A34A;">{result.gating_result.signal_count}</div>
-                <div style="font-size: 0.8rem; color: var(--brand-slate);">Signals</div>
-            </div>
-            <div style="background: #F3F4F6; padding: 12px; border-radius: 8px; text-align: center; border: 1px solid #E5E7EB;">
-                <div style="font-size: 1.2rem; font-weight: 700; color: #4B5563;">{result.gating_result.noise_count}</div>
-                <div style="font-size: 0.8rem; color: var(--brand-slate);">Filtered</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown("#### ⚡ Pipeline Performance\n\n" + _PERF_GRID_TPL.format_map({
+            'latency': result.processing_time_ms,
+            'events': len(events),
+            'signals': result.gating_result.signal_count,
+            'filtered': result.gating_result.noise_count
+        }), unsafe_allow_html=True)
     
     with col2:
-        st.markdown("#### 📊 Category Distribution")
         dist = result.clustering_result.category_distribution
-        for cat, count in dist.items():
-            pct = count / sum(dist.values()) * 100 if dist.values() else 0
-            st.markdown(f"""
-            <div style="margin-bottom: 12px;">
-                <div style="color: var(--brand-onyx); margin-bottom: 4px; font-weight: 500;">{cat}: {count} signals</div>
-                <div class="risk-bar-container" style="background: #E5E7EB;">
-                    <div class="risk-bar-fill" style="width: {pct}%;"></div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("#### 📊 Category Distribution\n\n" + build_category_bars_html(tuple(dist.items())),
+                    unsafe_allow_html=True)
     
     # Monte Carlo Simulation
-    st.markdown("---")
-    st.markdown("#### 🎲 Risk Simulation (Monte Carlo)")
+    st.markdown("---\n\n#### 🎲 Risk Simulation (Monte Carlo)")
     
     with st.form("simulation_form"):
         col1, col2, col3 = st.columns(3)
@@ -1046,120 +1360,127 @@ def render_analytics_tab(result, events):
         
         if st.form_submit_button("Run Simulation", type="primary"):
             with st.spinner("Running 5,000 Monte Carlo iterations..."):
-                sim = SimulationEngine(iterations=5000)
-                sim_result = sim.run_simulation(interest_rate, downtime, reg_fine, volatility, cyber_cost)
+                sim_result = run_simulation_cached(5000, interest_rate, downtime, reg_fine, volatility, cyber_cost)
                 
-                st.markdown(f"""
-                <div class="glass-card" style="text-align: center; margin-top: 20px; border-top: 4px solid var(--risk-high);">
-                    <div style="font-size: 3rem; font-weight: 800; color: {'#EF4444' if sim_result['is_breach'] else '#10B981'};">
-                        {sim_result['breach_probability']:.1%}
-                    </div>
-                    <div style="color: var(--brand-slate);">Probability of Risk Threshold Breach</div>
-                    <hr style="border-color: var(--brand-cloud); margin: 20px 0;">
-                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px; text-align: center;">
-                        <div>
-                            <div style="color: var(--brand-sunrise); font-size: 1.5rem; font-weight: 700;">${sim_result['mean_impact']:.1f}M</div>
-                            <div style="color: var(--brand-slate);">Mean Impact</div>
-                        </div>
-                        <div>
-                            <div style="color: #EA580C; font-size: 1.5rem; font-weight: 700;">${sim_result['var_95']:.1f}M</div>
-                            <div style="color: var(--brand-slate);">VaR (95%)</div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(_SIM_RESULT_TPL.format_map({
+                    'color': '#EF4444' if sim_result['is_breach'] else '#10B981',
+                    'breach_probability': sim_result['breach_probability'],
+                    'mean_impact': sim_result['mean_impact'],
+                    'var_95': sim_result['var_95']
+                }), unsafe_allow_html=True)
 
 # ==============================================================================
 # MAIN APP
 # ==============================================================================
 
+MAIN_TABS = (
+    "📥 Signal Triage",
+    "🚀 Escalation Hub",
+    "📊 Audit Trail",
+    "🏛️ Governance",
+    "📈 Analytics"
+)
+
 def main():
     # Hero Header
     render_hero()
     
+    # Admin: force the cached pipeline to re-run instead of waiting for its TTL
+    if st.sidebar.button("🔄 Reload Pipeline Data", use_container_width=True):
+        load_pipeline_data.clear()
+    
     # Load Pipeline Data
     with st.spinner("Loading AI Pipeline..."):
-        result, events = load_pipeline_data()
-        st.session_state['pipeline_result'] = result
+        csv_path = get_signals_csv_path()
+        csv_mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
+        try:
+            result, events, ranked, viral = load_pipeline_data(csv_path, csv_mtime)
+        except Exception as e:
+            st.error(f"Pipeline error: {e}")
+            result, events, ranked, viral = None, [], [], []
+        
+        # Cached cards belong to one pipeline run; drop them when the loader re-runs
+        if result and st.session_state.get('_card_cache_run') != result.timestamp:
+            st.session_state['_card_cache'].clear()
+            st.session_state['_card_html_cache'].clear()
+            st.session_state['_card_cache_run'] = result.timestamp
         
         # EMERGENCY BYPASS PROTOCOL (Run outside cache)
-        if result and result.cluster_analyses:
-            for cluster_analysis in result.cluster_analyses:
-                if getattr(cluster_analysis.cluster, 'is_viral', False):
-                    # Check if not already in escalated/audit log to avoid dupes
-                    exists = any(c.cluster.cluster_id == cluster_analysis.cluster.cluster_id for c in st.session_state['escalated_signals'])
-                    if not exists:
-                        st.session_state['escalated_signals'].append(cluster_analysis)
-                        st.toast(f"🚨 EMERGENCY ALERT: Viral Incident {cluster_analysis.cluster.cluster_id} Bypassed Triage!", icon="🚨")
+        escalated = st.session_state['escalated_signals']
+        new_viral = []
+        for cluster_analysis in viral:
+            # Check if not already escalated to avoid dupes
+            cid = cluster_analysis.cluster.cluster_id
+            if cid not in escalated:
+                escalated[cid] = cluster_analysis
+                new_viral.append(cid)
+        
+        # One toast for the whole batch rather than one per incident
+        if len(new_viral) == 1:
+            st.toast(f"🚨 EMERGENCY ALERT: Viral Incident {new_viral[0]} Bypassed Triage!", icon="🚨")
+        elif new_viral:
+            more = "..." if len(new_viral) > 3 else ""
+            st.toast(f"🚨 EMERGENCY ALERT: {len(new_viral)} Viral Incidents Bypassed Triage ({', '.join(new_viral[:3])}{more})", icon="🚨")
     
     # KPI Metrics
     if result:
-        render_kpis(result, events)
-    
-    # Main Tabs
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📥 Signal Triage",
-        "🚀 Escalation Hub", 
-        "📊 Audit Trail",
-        "🏛️ Governance",
-        "📈 Analytics"
-    ])
+        render_kpis(result, events, ranked)
+    
+    # Main Tabs: st.tabs would run every tab body on each rerun, so only the selected view renders
+    active_tab = st.radio("View", MAIN_TABS, horizontal=True, key="active_tab", label_visibility="collapsed")
     
     # TAB 1: Signal Triage
-    with tab1:
-        st.markdown("""
-        <div class="decision-banner">
-            <span class="decision-banner-icon">🤖</span>
-            <div>
-                <div class="decision-banner-text">AI-Assisted Signal Triage</div>
-                <div class="decision-banner-sub">Review signals below. AI provides reasoning — you make the decision.</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+    if active_tab == MAIN_TABS[0]:
+        st.markdown(_DECISION_BANNER_HTML, unsafe_allow_html=True)
         
         if result and result.cluster_analyses:
             # Filter out already processed signals
-            escalated_ids = [a.cluster.cluster_id for a in st.session_state['escalated_signals']]
-            dismissed_ids = [a.cluster.cluster_id for a in st.session_state['dismissed_signals']]
-            
-            pending = [a for a in result.cluster_analyses 
-                      if a.cluster.cluster_id not in escalated_ids 
-                      and a.cluster.cluster_id not in dismissed_ids]
+            # (both are dicts keyed by cluster_id, so membership is O(1))
+            escalated = st.session_state['escalated_signals']
+            dismissed = st.session_state['dismissed_signals']
             
-            # Sort by risk score
-            pending.sort(key=lambda x: x.risk_score.total_score, reverse=True)
+            # ranked is already sorted by risk score, so pending keeps that order
+            pending = [a for a in ranked 
+                      if a.cluster.cluster_id not in escalated 
+                      and a.cluster.cluster_id not in dismissed]
             
             if pending:
                 st.markdown(f"**{len(pending)} signals awaiting review**")
-                for analysis in pending:
-                    render_signal_card(analysis, show_actions=True, key_prefix="triage")
+                
+                # Windowed rendering: highest-risk cards first, the rest behind "Load more"
+                visible = SIGNAL_PAGE_SIZE * st.session_state['signal_page']
+                render_signal_cards_batch(pending[:visible], show_actions=True, key_prefix="triage")
+                
+                if len(pending) > visible:
+                    st.caption(f"Showing {visible} of {len(pending)} signals")
+                    st.button("⬇️ Load more", key="triage_load_more", use_container_width=True,
+                              on_click=_load_more_signals)
             else:
                 st.success("✅ All signals have been processed!")
         else:
             st.warning("No signals loaded. Check pipeline configuration.")
     
     # TAB 2: Escalation Hub
-    with tab2:
+    elif active_tab == MAIN_TABS[1]:
         st.markdown("### 🚀 Escalation Hub")
         st.markdown("Review escalated signals and route to appropriate departments.")
         
         if st.session_state['escalated_signals']:
-            for analysis in st.session_state['escalated_signals']:
+            for analysis in list(st.session_state['escalated_signals'].values()):
                 render_escalation_card(analysis)
-                st.divider()
         else:
             st.info("No escalated signals yet. Escalate signals from the Triage tab.")
     
     # TAB 3: Audit Trail
-    with tab3:
+    elif active_tab == MAIN_TABS[2]:
         render_audit_log()
     
     # TAB 4: Governance
-    with tab4:
+    elif active_tab == MAIN_TABS[3]:
         render_governance_center()
     
     # TAB 5: Analytics
-    with tab5:
+    elif active_tab == MAIN_TABS[4]:
         render_analytics_tab(result, events)
 
 if __name__ == "__main__":
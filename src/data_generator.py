@@ -11,6 +11,25 @@ fake = Faker()
 # Configuration
 OUTPUT_DIR = "./data"
 
+CUSTOMER_TIERS = ("Standard", "Gold", "Platinum", "Private Banking")
+DEVICES = ("iOS", "Android", "Web")
+
+NOISE_TOPICS = (
+    ("Support Ticket", "I forgot my password"),
+    ("App Log", "User logged in successfully"),
+    ("ATM Log", "Cash withdrawal successful"),
+    ("Support Ticket", "What are the branch hours?"),
+    ("Tweet", "Just got my new card, looks great!")
+)
+
+PANIC_PHRASES = (
+    "Is my money safe?",
+    "I saw a tweet saying you have no cash.",
+    "Why can't I withdraw 50k right now?",
+    "Are you insolvent?",
+    "I want to close my account immediately."
+)
+
 class SyntheticDataGenerator:
     def __init__(self):
         self.customers = self._generate_customers(100)
@@ -18,14 +37,16 @@ class SyntheticDataGenerator:
     def _generate_customers(self, count):
         """Generate consistent customer profiles."""
         print(f"Generating {count} customer profiles...")
-        customers = []
-        for _ in range(count):
-            customers.append({
-                "user_id": str(uuid.uuid4())[:8],
+        # Draw every tier in one call instead of one choice() per customer
+        tiers = random.choices(CUSTOMER_TIERS, k=count)
+        return [
+            {
+                "user_id": uuid.uuid4().hex[:8],
                 "name": fake.name(),
-                "tier": random.choice(["Standard", "Gold", "Platinum", "Private Banking"])
-            })
-        return customers
+                "tier": tier
+            }
+            for tier in tiers
+        ]
 
     def create_event(self, timestamp, source, content, user=None, latency=None):
         """Helper to create a standard event structure."""
@@ -41,7 +62,7 @@ class SyntheticDataGenerator:
             "content": content,
             "metadata": {
                 "latency_ms": latency if latency else random.randint(20, 100),
-                "device": random.choice(["iOS", "Android", "Web"]),
+                "device": random.choice(DEVICES),
                 "ip_address": fake.ipv4()
             }
         }
@@ -53,14 +74,7 @@ class SyntheticDataGenerator:
             offset = random.randint(0, duration_minutes * 60)
             ts = start_time + timedelta(seconds=offset)
             
-            topics = [
-                ("Support Ticket", "I forgot my password"),
-                ("App Log", "User logged in successfully"),
-                ("ATM Log", "Cash withdrawal successful"),
-                ("Support Ticket", "What are the branch hours?"),
-                ("Tweet", "Just got my new card, looks great!")
-            ]
-            source, topic = random.choice(topics)
+            source, topic = random.choice(NOISE_TOPICS)
             events.append(self.create_event(ts, source, f"{topic} - {fake.sentence()}"))
         return events
 
@@ -87,15 +101,7 @@ class SyntheticDataGenerator:
         for i in range(10):
             offset = 16 + i # Minutes after base time (1 min after tweet starts)
             ts = base_time + timedelta(minutes=offset, seconds=random.randint(0, 59))
-            
-            phrases = [
-                "Is my money safe?",
-                "I saw a tweet saying you have no cash.",
-                "Why can't I withdraw 50k right now?",
-                "Are you insolvent?",
-                "I want to close my account immediately."
-            ]
-            events.append(self.create_event(ts, "Support Ticket", random.choice(phrases), latency=random.randint(50, 200)))
+            events.append(self.create_event(ts, "Support Ticket", random.choice(PANIC_PHRASES), latency=random.randint(50, 200)))
 
         # 3. Add Noise
         noise = self.generate_noise(base_time, 45, count=40)
@@ -144,8 +150,10 @@ class SyntheticDataGenerator:
         return full_stream
 
     def save_to_file(self, data, filename):
+        # Encode up front and write once; json.dump() issues a write per token chunk
+        payload = json.dumps(data, indent=2)
         with open(f"{OUTPUT_DIR}/{filename}", 'w') as f:
-            json.dump(data, f, indent=2)
+            f.write(payload)
         print(f"Saved {len(data)} records to {filename}")
 
 if __name__ == "__main__":
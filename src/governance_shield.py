@@ -118,6 +118,16 @@ class GovernanceShield:
             "escalation_target": escalation_target
         }
 
+# Singleton
+_shield = None
+
+def get_governance_shield() -> GovernanceShield:
+    """Get the singleton GovernanceShield instance."""
+    global _shield
+    if _shield is None:
+        _shield = GovernanceShield()
+    return _shield
+
 # Example Usage Test
 if __name__ == "__main__":
     shield = GovernanceShield()
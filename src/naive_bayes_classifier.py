@@ -156,18 +156,27 @@ class NaiveBayesClassifier:
         self._build_vocabulary()
     
     def _build_vocabulary(self):
-        """Build the vocabulary from class keywords."""
+        """Build the vocabulary and precomputed log-weight tables from class keywords."""
         self.vocabulary = set()
         for keywords in self.CLASS_KEYWORDS.values():
             self.vocabulary.update(keywords.keys())
+        
+        # Log priors and per-keyword log-likelihoods are constant, so compute them once
+        # instead of calling np.log for every keyword of every event.
+        self.log_priors = {cls: np.log(self.class_priors[cls]) for cls in self.CLASSES}
+        self.keyword_log_weights = {
+            cls: {keyword: np.log(1 + weight) for keyword, weight in keywords.items()}
+            for cls, keywords in self.CLASS_KEYWORDS.items()
+        }
+        self._excluded_regexes = [re.compile(p, flags=re.IGNORECASE) for p in self.EXCLUDED_PATTERNS]
     
     def _preprocess(self, text: str) -> str:
         """Preprocess text: lowercase, remove sensitive patterns."""
         text = text.lower()
         
         # Remove sensitive demographic proxies
-        for pattern in self.EXCLUDED_PATTERNS:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        for regex in self._excluded_regexes:
+            text = regex.sub('', text)
         
         # Remove URLs
         text = re.sub(r'https?://\S+', '', text)
@@ -207,14 +216,15 @@ class NaiveBayesClassifier:
         
         for cls in self.CLASSES:
             # Start with log prior
-            score = np.log(self.class_priors[cls])
+            score = self.log_priors[cls]
             
             # Add keyword contributions
-            class_keywords = self.CLASS_KEYWORDS[cls]
+            log_weights = self.keyword_log_weights[cls]
             for keyword, count in keywords.items():
-                if keyword in class_keywords:
+                log_weight = log_weights.get(keyword)
+                if log_weight is not None:
                     # Log-likelihood contribution
-                    score += count * np.log(1 + class_keywords[keyword])
+                    score += count * log_weight
             
             scores[cls] = score
         
@@ -140,7 +140,7 @@ class ClusterAnalysis:
             "consensus_notes": consensus_notes[:3],  # Top 3 notes
             
             # Incident Management / Virality
-            "is_viral": getattr(self.cluster, 'is_viral', False),
+            "is_viral": self.cluster.is_viral,
             "velocity_growth_pct": getattr(self.cluster, 'velocity_growth_pct', 0.0),
             
             # Strategic Ambiguity Gauge Logic
@@ -36,6 +36,12 @@ class CorrelationResult:
     matched_system: str
     action_required: bool
 
+@dataclass
+class IncidentSnapshot:
+    health: Dict[str, SystemHealth]
+    correlation: CorrelationResult
+    briefing: str
+
 class TelemetryEngine:
     
     SYSTEMS = [
@@ -83,7 +89,12 @@ class TelemetryEngine:
             self._refresh_system_status()
         return self.status_cache
 
-    def correlate_signal(self, signal_category: str, signal_text: str) -> CorrelationResult:
+    def correlate_signal(
+        self,
+        signal_category: str,
+        signal_text: str,
+        health: Optional[Dict[str, SystemHealth]] = None
+    ) -> CorrelationResult:
         """
         Correlate a social signal with internal system health.
         Logic:
@@ -91,7 +102,8 @@ class TelemetryEngine:
         - SERVICE + Healthy System = Misinformation/Rumor (Low Confidence in Alert)
         - FRAUD + Latent SMS = Active Fraud Pattern
         """
-        health = self.get_system_health()
+        if health is None:
+            health = self.get_system_health()
         
         # Default
         return CorrelationResult(
@@ -141,13 +153,29 @@ class TelemetryEngine:
                 action_required=False
             )
 
-    def generate_executive_briefing(self, analysis_card: Dict[str, Any]) -> str:
+    def get_incident_snapshot(
+        self,
+        analysis_card: Dict[str, Any],
+        briefing: Optional[str] = None,
+        health: Optional[Dict[str, SystemHealth]] = None
+    ) -> IncidentSnapshot:
         """
-        Generate a 3-sentence executive briefing using Groq.
-        Include Financial Exposure (VaR/Ops Loss).
+        Fetch system health once (unless a snapshot is passed in) and derive the
+        correlation (and briefing, unless one is passed in) from that same snapshot.
         """
-        
-        # Template-based fallback (for Rate Limits or Errors)
+        if health is None:
+            health = self.get_system_health()
+        correlation = self.correlate_signal(
+            analysis_card.get('category', ''),
+            analysis_card.get('rationale', {}).get('what_signal', ''),
+            health=health
+        )
+        if briefing is None:
+            briefing = self.generate_executive_briefing(analysis_card)
+        return IncidentSnapshot(health=health, correlation=correlation, briefing=briefing)
+
+    def fallback_briefing(self, analysis_card: Dict[str, Any], error: Exception) -> str:
+        """Template-based briefing used when the LLM call fails (rate limits or errors)."""
         title = analysis_card.get('title', 'Incident')
         cat = analysis_card.get('category', 'ALERT')
         
@@ -156,6 +184,20 @@ class TelemetryEngine:
             f"**Financial Exposure**: Estimated Operational Value at Risk (VaR) ranges from $50k to $150k depending on duration. "
             f"**Action**: Immediate escalation to {cat} Response Team requires verification of internal logs."
         )
+        
+        # Check for Rate Limit specific errors to avoid logging them as scary failures
+        err_str = str(error).lower()
+        if "429" in err_str or "rate limit" in err_str:
+             return fallback_briefing
+        return f"⚠️ [Briefing Unavailable] {fallback_briefing}"
+
+    def generate_executive_briefing(self, analysis_card: Dict[str, Any], raise_errors: bool = False) -> str:
+        """
+        Generate a 3-sentence executive briefing using Groq.
+        Include Financial Exposure (VaR/Ops Loss).
+        With `raise_errors`, LLM failures propagate instead of returning the fallback,
+        so callers that cache the result never cache a degraded briefing.
+        """
 
         prompt = ChatPromptTemplate.from_template("""
         You are a Chief Risk Officer at a major bank. Write a TIGHT, 3-SENTENCE Executive Briefing for this incident.
@@ -183,11 +225,9 @@ class TelemetryEngine:
             })
             return response.content
         except Exception as e:
-            # Check for Rate Limit specific errors to avoid logging them as scary failures
-            err_str = str(e).lower()
-            if "429" in err_str or "rate limit" in err_str:
-                 return fallback_briefing
-            return f"⚠️ [Briefing Unavailable] {fallback_briefing}"
+            if raise_errors:
+                raise
+            return self.fallback_briefing(analysis_card, e)
 
 # Singleton
 _engine = None